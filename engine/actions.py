@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
-from engine.types import Direction, ItemLocation, ParsedCommand
+from types import MappingProxyType
+
+from engine.types import INVENTORY, Direction, ParsedCommand
 from engine.game_state import GameState
 from engine.world import World
 
+_DIR_LOOKUP: dict[str, Direction] = {d.value: d for d in Direction}
+
 
 def handle_go(cmd: ParsedCommand, state: GameState,
               world: World) -> list[str]:
     if not cmd.noun:
         return ["Go where?"]
 
-    try:
-        direction = Direction(cmd.noun)
-    except ValueError:
+    direction = _DIR_LOOKUP.get(cmd.noun)
+    if direction is None:
         return [f"I don't understand the direction '{cmd.noun}'."]
 
     room = world.get_room(state.current_room)
@@ -41,6 +44,19 @@ def handle_go(cmd: ParsedCommand, state: GameState,
 
 def _describe_room(room, state: GameState, world: World,
                    first_visit: bool = False) -> list[str]:
+    # The description only depends on flags and item positions, so it is
+    # reused until either changes.
+    key = (first_visit, world.version, state.flag_version)
+    cached = room.describe_cache
+    if cached is not None and cached[0] == key:
+        return list(cached[1])
+    msgs = _build_room_description(room, state, world, first_visit)
+    room.describe_cache = (key, msgs)
+    return list(msgs)
+
+
+def _build_room_description(room, state: GameState, world: World,
+                            first_visit: bool) -> list[str]:
     msgs: list[str] = []
 
     # Dark room check
@@ -48,7 +64,7 @@ def _describe_room(room, state: GameState, world: World,
         msgs.append(room.dark_description)
         return msgs
 
-    msgs.append(f"\n--- {room.name} ---")
+    msgs.append(room.header)
     msgs.append(room.description)
 
     if first_visit and room.first_visit_text:
@@ -61,18 +77,29 @@ def _describe_room(room, state: GameState, world: World,
             msgs.append(item.room_description)
 
     # Exits
-    exits = []
-    for ex in room.exits:
-        label = ex.direction.value.capitalize()
-        if ex.locked and not (ex.lock_flag and state.flag_is_set(ex.lock_flag)):
-            label += " (locked)"
-        exits.append(label)
-    if exits:
-        msgs.append("Exits: " + ", ".join(exits))
+    exits_label = _exits_label(room, state)
+    if exits_label:
+        msgs.append(exits_label)
 
     return msgs
 
 
+def _exits_label(room, state: GameState) -> str:
+    """Build the "Exits: ..." line, reusing the last one if no lock changed."""
+    locked = tuple(
+        ex.locked and not (ex.lock_flag and state.flag_is_set(ex.lock_flag))
+        for ex in room.exits)
+    cached = room.exit_label_cache
+    if cached is not None and cached[0] == locked:
+        return cached[1]
+
+    exits = [ex.label + " (locked)" if is_locked else ex.label
+             for ex, is_locked in zip(room.exits, locked)]
+    text = "Exits: " + ", ".join(exits) if exits else ""
+    room.exit_label_cache = (locked, text)
+    return text
+
+
 def _has_light(state: GameState, world: World) -> bool:
     return state.flag_is_set("has_light")
 
@@ -90,11 +117,9 @@ def handle_examine(cmd: ParsedCommand, state: GameState,
     if not cmd.noun:
         return ["Examine what?"]
 
-    items = world.resolve_noun_to_items(cmd.noun)
-    for item in items:
-        if (item.location == state.current_room or
-                item.location == ItemLocation.INVENTORY.value):
-            return [item.description]
+    item = world.find_item(cmd.noun, state.current_room, INVENTORY)
+    if item:
+        return [item.description]
 
     return [f"You don't see any '{cmd.noun}' here."]
 
@@ -104,20 +129,18 @@ def handle_take(cmd: ParsedCommand, state: GameState,
     if not cmd.noun:
         return ["Take what?"]
 
-    items = world.resolve_noun_to_items(cmd.noun)
-    for item in items:
-        if item.location == state.current_room:
-            if not item.takeable:
-                return [f"You can't take the {item.name}."]
-            inv = world.items_in_inventory()
-            if len(inv) >= 10:
-                return ["You're carrying too much already."]
-            world.move_item(item.id, ItemLocation.INVENTORY.value)
-            return [f"Taken: {item.name}"]
-        if item.location == ItemLocation.INVENTORY.value:
-            return ["You already have that."]
-
-    return [f"You don't see any '{cmd.noun}' here."]
+    item = world.find_item(cmd.noun, state.current_room, INVENTORY)
+    if item is None:
+        return [f"You don't see any '{cmd.noun}' here."]
+    if item.location == INVENTORY:
+        return ["You already have that."]
+    if not item.takeable:
+        return [f"You can't take the {item.name}."]
+    inv = world.items_in_inventory()
+    if len(inv) >= 10:
+        return ["You're carrying too much already."]
+    world.move_item(item.id, INVENTORY)
+    return [f"Taken: {item.name}"]
 
 
 def handle_drop(cmd: ParsedCommand, state: GameState,
@@ -125,11 +148,10 @@ def handle_drop(cmd: ParsedCommand, state: GameState,
     if not cmd.noun:
         return ["Drop what?"]
 
-    items = world.resolve_noun_to_items(cmd.noun)
-    for item in items:
-        if item.location == ItemLocation.INVENTORY.value:
-            world.move_item(item.id, state.current_room)
-            return [f"Dropped: {item.name}"]
+    item = world.find_item(cmd.noun, INVENTORY)
+    if item:
+        world.move_item(item.id, state.current_room)
+        return [f"Dropped: {item.name}"]
 
     return ["You're not carrying that."]
 
@@ -158,27 +180,26 @@ def handle_combine(cmd: ParsedCommand, state: GameState,
     if not cmd.noun:
         return ["Combine what with what?"]
 
-    parts = cmd.noun.split(" with ")
-    if len(parts) != 2:
+    noun1, sep, noun2 = cmd.noun.partition(" with ")
+    if not sep or " with " in noun2:
         return ["Try: COMBINE <item> WITH <item>"]
 
-    noun1, noun2 = parts[0].strip(), parts[1].strip()
+    noun1, noun2 = noun1.strip(), noun2.strip()
 
     items1 = world.resolve_noun_to_items(noun1)
     items2 = world.resolve_noun_to_items(noun2)
 
     for item1 in items1:
-        if item1.location != ItemLocation.INVENTORY.value:
+        if item1.location != INVENTORY:
             continue
         for item2 in items2:
-            if item2.location != ItemLocation.INVENTORY.value:
+            if item2.location != INVENTORY:
                 continue
             # Check if they can combine
             if item1.combine_with == item2.id and item1.combine_result:
                 world.destroy_item(item1.id)
                 world.destroy_item(item2.id)
-                world.move_item(item1.combine_result,
-                                ItemLocation.INVENTORY.value)
+                world.move_item(item1.combine_result, INVENTORY)
                 result_item = world.get_item(item1.combine_result)
                 msg = item1.combine_message or (
                     f"You combine the {item1.name} and {item2.name}.")
@@ -188,8 +209,7 @@ def handle_combine(cmd: ParsedCommand, state: GameState,
             if item2.combine_with == item1.id and item2.combine_result:
                 world.destroy_item(item1.id)
                 world.destroy_item(item2.id)
-                world.move_item(item2.combine_result,
-                                ItemLocation.INVENTORY.value)
+                world.move_item(item2.combine_result, INVENTORY)
                 result_item = world.get_item(item2.combine_result)
                 msg = item2.combine_message or (
                     f"You combine the {item1.name} and {item2.name}.")
@@ -206,8 +226,8 @@ def handle_score(cmd: ParsedCommand, state: GameState,
             f"(Turns: {state.turns})"]
 
 
-# Registry of built-in handlers
-BUILTIN_HANDLERS: dict[str, callable] = {
+# Registry of built-in handlers (read-only)
+BUILTIN_HANDLERS: MappingProxyType[str, callable] = MappingProxyType({
     "go": handle_go,
     "look": handle_look,
     "examine": handle_examine,
@@ -217,4 +237,4 @@ BUILTIN_HANDLERS: dict[str, callable] = {
     "use": handle_use,
     "combine": handle_combine,
     "score": handle_score,
-}
+})
@@ -2,59 +2,193 @@
 
 from __future__ import annotations
 
-from engine.types import Condition, ConditionType, ItemLocation
+from typing import Callable
+
+from engine.types import Condition, ConditionType, INVENTORY, NOWHERE
 from engine.game_state import GameState
 from engine.world import World
 
 
-def evaluate(condition: Condition, state: GameState, world: World) -> bool:
-    ct = condition.type
-    target = condition.target
+def _carrying(condition: Condition, state: GameState, world: World) -> bool:
+    return world.is_at(condition.target, INVENTORY)
+
+
+def _not_carrying(condition: Condition, state: GameState,
+                  world: World) -> bool:
+    return not world.is_at(condition.target, INVENTORY)
+
+
+def _here(condition: Condition, state: GameState, world: World) -> bool:
+    return world.is_at(condition.target, state.current_room)
+
+
+def _not_here(condition: Condition, state: GameState, world: World) -> bool:
+    return not world.is_at(condition.target, state.current_room)
+
 
-    if ct == ConditionType.CARRYING:
-        item = world.get_item(target)
-        return item is not None and item.location == ItemLocation.INVENTORY.value
+def _in_room(condition: Condition, state: GameState, world: World) -> bool:
+    return state.current_room == condition.target
 
-    if ct == ConditionType.NOT_CARRYING:
-        item = world.get_item(target)
-        return item is None or item.location != ItemLocation.INVENTORY.value
 
-    if ct == ConditionType.HERE:
-        item = world.get_item(target)
-        return item is not None and item.location == state.current_room
+def _not_in_room(condition: Condition, state: GameState,
+                 world: World) -> bool:
+    return state.current_room != condition.target
+
+
+# The flag checks read state.flags directly, skipping a method call
+def _flag_set(condition: Condition, state: GameState, world: World) -> bool:
+    return condition.target in state.flags
+
 
-    if ct == ConditionType.NOT_HERE:
-        item = world.get_item(target)
-        return item is None or item.location != state.current_room
+def _flag_unset(condition: Condition, state: GameState, world: World) -> bool:
+    return condition.target not in state.flags
 
-    if ct == ConditionType.IN_ROOM:
-        return state.current_room == target
 
-    if ct == ConditionType.NOT_IN_ROOM:
-        return state.current_room != target
+def _counter_ge(condition: Condition, state: GameState,
+                world: World) -> bool:
+    return state.get_counter(condition.target) >= (condition.value or 0)
 
-    if ct == ConditionType.FLAG_SET:
-        return state.flag_is_set(target)
 
-    if ct == ConditionType.FLAG_UNSET:
-        return not state.flag_is_set(target)
+def _counter_le(condition: Condition, state: GameState,
+                world: World) -> bool:
+    return state.get_counter(condition.target) <= (condition.value or 0)
 
-    if ct == ConditionType.COUNTER_GE:
-        return state.get_counter(target) >= (condition.value or 0)
 
-    if ct == ConditionType.COUNTER_LE:
-        return state.get_counter(target) <= (condition.value or 0)
+def _counter_eq(condition: Condition, state: GameState,
+                world: World) -> bool:
+    return state.get_counter(condition.target) == (condition.value or 0)
 
-    if ct == ConditionType.COUNTER_EQ:
-        return state.get_counter(target) == (condition.value or 0)
 
-    if ct == ConditionType.EXISTS:
-        item = world.get_item(target)
-        return item is not None and item.location != ItemLocation.NOWHERE.value
+def _exists(condition: Condition, state: GameState, world: World) -> bool:
+    return world.item_location(condition.target) != NOWHERE
 
+
+def _always_false(condition: Condition, state: GameState,
+                  world: World) -> bool:
     return False
 
 
+_HANDLERS: dict[ConditionType,
+                Callable[[Condition, GameState, World], bool]] = {
+    ConditionType.CARRYING: _carrying,
+    ConditionType.NOT_CARRYING: _not_carrying,
+    ConditionType.HERE: _here,
+    ConditionType.NOT_HERE: _not_here,
+    ConditionType.IN_ROOM: _in_room,
+    ConditionType.NOT_IN_ROOM: _not_in_room,
+    ConditionType.FLAG_SET: _flag_set,
+    ConditionType.FLAG_UNSET: _flag_unset,
+    ConditionType.COUNTER_GE: _counter_ge,
+    ConditionType.COUNTER_LE: _counter_le,
+    ConditionType.COUNTER_EQ: _counter_eq,
+    ConditionType.EXISTS: _exists,
+}
+
+
+# Relative cost of each check. Flags, rooms and counters read GameState
+# directly; item checks go through World's location index.
+_COST: dict[ConditionType, int] = {
+    ConditionType.IN_ROOM: 0,
+    ConditionType.NOT_IN_ROOM: 0,
+    ConditionType.FLAG_SET: 0,
+    ConditionType.FLAG_UNSET: 0,
+    ConditionType.COUNTER_GE: 0,
+    ConditionType.COUNTER_LE: 0,
+    ConditionType.COUNTER_EQ: 0,
+    ConditionType.CARRYING: 1,
+    ConditionType.NOT_CARRYING: 1,
+    ConditionType.HERE: 1,
+    ConditionType.NOT_HERE: 1,
+    ConditionType.EXISTS: 1,
+}
+
+
+def _cost(condition: Condition) -> int:
+    return _COST.get(condition.type, 0)
+
+
+def order_by_cost(conditions: list[Condition]) -> list[Condition]:
+    """Cheapest first, so evaluate_all can bail out early.
+
+    Conditions have no side effects, so the order does not change the
+    result. The sort is stable: equal-cost conditions keep their order."""
+    if len(conditions) < 2:
+        return conditions
+    return sorted(conditions, key=_cost)
+
+
+# Memo for one dispatch: (type, target, value) -> result
+ConditionCache = dict[tuple[ConditionType, str, int | None], bool]
+
+
+def evaluate(condition: Condition, state: GameState, world: World,
+             cache: ConditionCache | None = None) -> bool:
+    """Evaluate one condition.
+
+    With a cache, identical conditions are only computed once. The caller
+    owns the cache and must drop it once state may have changed."""
+    if cache is None:
+        return _HANDLERS.get(condition.type, _always_false)(
+            condition, state, world)
+    key = (condition.type, condition.target, condition.value)
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = _HANDLERS.get(condition.type, _always_false)(
+            condition, state, world)
+    return result
+
+
 def evaluate_all(conditions: list[Condition], state: GameState,
-                 world: World) -> bool:
-    return all(evaluate(c, state, world) for c in conditions)
+                 world: World, cache: ConditionCache | None = None) -> bool:
+    for c in conditions:
+        if not evaluate(c, state, world, cache):
+            return False
+    return True
+
+
+# Compiled condition list: (state, world, cache) -> all conditions hold
+Guard = Callable[[GameState, World, ConditionCache | None], bool]
+
+
+def _no_conditions(state: GameState, world: World,
+                   cache: ConditionCache | None = None) -> bool:
+    return True
+
+
+def compile_guard(conditions: list[Condition]) -> Guard:
+    """Specialize evaluate_all for one condition list.
+
+    Handlers and cache keys are looked up once here instead of on every
+    evaluation, and the common no-condition and one-condition cases get
+    their own closures. The guard checks conditions in the given order."""
+    if not conditions:
+        return _no_conditions
+    checks = tuple((c, _HANDLERS.get(c.type, _always_false),
+                    (c.type, c.target, c.value)) for c in conditions)
+
+    if len(checks) == 1:
+        (condition, handler, key), = checks
+
+        def guard(state: GameState, world: World,
+                  cache: ConditionCache | None = None) -> bool:
+            if cache is None:
+                return handler(condition, state, world)
+            result = cache.get(key)
+            if result is None:
+                result = cache[key] = handler(condition, state, world)
+            return result
+        return guard
+
+    def guard(state: GameState, world: World,
+              cache: ConditionCache | None = None) -> bool:
+        for condition, handler, key in checks:
+            if cache is None:
+                result = handler(condition, state, world)
+            else:
+                result = cache.get(key)
+                if result is None:
+                    result = cache[key] = handler(condition, state, world)
+            if not result:
+                return False
+        return True
+    return guard
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import sys
 import textwrap
 
 
@@ -22,17 +24,28 @@ class Pager:
         if not self.enabled:
             print(text)
             return
-        for line in text.split("\n"):
+        if "\n" not in text and self.line_count < self.page_height:
+            sys.stdout.write(text + "\n")
+            self.line_count += 1
+            return
+        # Write everything up to each page boundary in one call
+        lines = text.split("\n")
+        start = 0
+        while start < len(lines):
             if self.line_count >= self.page_height:
                 self._input_fn("[press enter]")
                 self.line_count = 0
-            print(line)
-            self.line_count += 1
+            room = max(1, self.page_height - self.line_count)
+            batch = lines[start:start + room]
+            sys.stdout.write("\n".join(batch) + "\n")
+            self.line_count += len(batch)
+            start += len(batch)
 
     def reset(self) -> None:
         self.line_count = 0
 
 
+@functools.lru_cache(maxsize=1024)
 def wrap(text: str, width: int = WIDTH) -> str:
     lines = text.split("\n")
     wrapped = []
@@ -2,54 +2,110 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right, insort
+from typing import Callable
+
 from engine.types import (
     Action, ActionType, Event, ItemLocation, ParsedCommand, Timer,
 )
-from engine.conditions import evaluate_all
+from engine.conditions import ConditionCache, compile_guard, order_by_cost
 from engine.game_state import GameState
 from engine.world import World
 
 
+def _firing_order(event: Event) -> int:
+    return -event.priority
+
+
+def _insert(event: Event, buckets: dict[str | None, list[Event]]) -> None:
+    """File event into room buckets; buckets[None] serves all other rooms.
+
+    A room=None event joins every bucket. A new room bucket starts as a
+    copy of the None bucket. insort places an event after any of equal
+    priority, so buckets stay in firing order."""
+    if event.room is None:
+        for bucket in buckets.values():
+            insort(bucket, event, key=_firing_order)
+        return
+    bucket = buckets.get(event.room)
+    if bucket is None:
+        bucket = buckets[event.room] = list(buckets[None])
+    insort(bucket, event, key=_firing_order)
+
+
+def _note_spent(room: str, bucket: list[Event], state: GameState) -> None:
+    """Record room in auto_done once its bucket holds only spent events."""
+    if all(e.once and e.done_flag in state.flags for e in bucket):
+        state.auto_done.add(room)
+
+
 class EventManager:
     def __init__(self, events: list[Event], timers: list[Timer]) -> None:
-        self.events = sorted(events, key=lambda e: -e.priority)
         self._timers_registry: dict[str, Timer] = {}
         for timer in timers:
             self._timers_registry[timer.name] = timer
-        self._event_index: dict[str, Event] = {e.id: e for e in events}
+
+        # All events in firing order: highest priority first, equal
+        # priorities in the order they were added
+        self.events: list[Event] = []
+        self._event_index: dict[str, Event] = {}
+        # Command events by verb, then room; auto events by room. Each
+        # bucket is in firing order and includes the room=None events.
+        self._by_verb: dict[str, dict[str | None, list[Event]]] = {}
+        self._auto_by_room: dict[str | None, list[Event]] = {None: []}
+        for event in events:
+            self.add_event(event)
+
+    def add_event(self, event: Event) -> None:
+        """Register an event, keeping every bucket in firing order.
+
+        Add auto events before play starts: rooms a GameState already
+        lists in auto_done are not re-examined."""
+        event.ordered_conditions = order_by_cost(event.conditions)
+        event.guard = compile_guard(event.ordered_conditions)
+        self._event_index[event.id] = event
+        insort(self.events, event, key=_firing_order)
+        if event.verb is None:
+            _insert(event, self._auto_by_room)
+        else:
+            _insert(event, self._by_verb.setdefault(event.verb, {None: []}))
 
     def get_event(self, event_id: str) -> Event | None:
         return self._event_index.get(event_id)
 
     def try_command_events(self, cmd: ParsedCommand, state: GameState,
-                           world: World) -> tuple[bool, list[str]]:
-        """Check events matching this command. Returns (handled, messages)."""
-        messages: list[str] = []
+                           world: World, out: list[str] | None = None
+                           ) -> tuple[bool, list[str]]:
+        """Check events matching this command. Returns (handled, messages).
+
+        Messages are appended to out when given, so a caller can reuse one
+        buffer across turns."""
+        messages = out if out is not None else []
         handled = False
+        # Nothing changes state until an event fires, and then we stop
+        cache: ConditionCache = {}
 
-        for event in self.events:
-            if event.verb is None:
-                continue  # skip auto-events
-            if event.verb != cmd.verb:
-                continue
+        candidates: list[Event] = []
+        rooms = self._by_verb.get(cmd.verb)
+        if rooms is not None:
+            candidates = rooms.get(state.current_room) or rooms[None]
+
+        for event in candidates:
             if event.noun is not None and event.noun != cmd.noun:
                 continue
-            if event.room is not None and event.room != state.current_room:
-                continue
 
             # Check once-flag
-            if event.once and state.flag_is_set(f"event_{event.id}_done"):
+            if event.once and event.done_flag in state.flags:
                 continue
 
-            if not evaluate_all(event.conditions, state, world):
+            if not event.guard(state, world, cache):
                 continue
 
             # Fire this event
-            msgs = self._execute_actions(event.actions, state, world)
-            messages.extend(msgs)
+            self._execute_actions(event.actions, state, world, messages)
 
             if event.once:
-                state.set_flag(f"event_{event.id}_done")
+                state.set_flag(event.done_flag)
 
             if event.override_builtin:
                 handled = True
@@ -58,33 +114,66 @@ class EventManager:
 
         return handled, messages
 
-    def run_auto_events(self, state: GameState,
-                        world: World) -> list[str]:
-        """Run all auto-events (verb=None) whose conditions are met."""
-        messages: list[str] = []
-
-        for event in self.events:
-            if event.verb is not None:
-                continue
-            if event.room is not None and event.room != state.current_room:
+    def run_auto_events(self, state: GameState, world: World,
+                        out: list[str] | None = None) -> list[str]:
+        """Run all auto-events (verb=None) whose conditions are met.
+
+        Messages are appended to out (returned) when given. Once every
+        auto event for a room is a spent once-only event, the room is
+        recorded in state.auto_done and later passes there are skipped."""
+        messages = out if out is not None else []
+
+        room = state.current_room
+        if room in state.auto_done:
+            return messages
+        bucket = self._auto_bucket(room)
+
+        fired = False
+        cache: ConditionCache = {}
+        i = 0
+        while i < len(bucket):
+            event = bucket[i]
+            i += 1
+            if event.once and event.done_flag in state.flags:
                 continue
-            if event.once and state.flag_is_set(f"event_{event.id}_done"):
-                continue
-            if not evaluate_all(event.conditions, state, world):
+            if not event.guard(state, world, cache):
                 continue
 
-            msgs = self._execute_actions(event.actions, state, world)
-            messages.extend(msgs)
+            self._execute_actions(event.actions, state, world, messages)
+            # The actions may have changed what the conditions see
+            cache.clear()
+            fired = True
 
             if event.once:
-                state.set_flag(f"event_{event.id}_done")
-
+                state.set_flag(event.done_flag)
+
+            if state.current_room != room:
+                # The player was moved: carry on with the new room's
+                # events that come after this one in firing order
+                _note_spent(room, bucket, state)
+                room = state.current_room
+                bucket = self._auto_bucket(room)
+                rank = {id(e): n for n, e in enumerate(self.events)}
+                i = bisect_right(bucket, rank[id(event)],
+                                 key=lambda e: rank[id(e)])
+                fired = False
+
+        if fired:
+            _note_spent(room, bucket, state)
         return messages
 
-    def tick_timers(self, state: GameState,
-                    world: World) -> list[str]:
-        """Tick all active timers and fire zero-events."""
-        messages: list[str] = []
+    def _auto_bucket(self, room: str) -> list[Event]:
+        bucket = self._auto_by_room.get(room)
+        if bucket is None:
+            bucket = self._auto_by_room[None]
+        return bucket
+
+    def tick_timers(self, state: GameState, world: World,
+                    out: list[str] | None = None) -> list[str]:
+        """Tick all active timers and fire zero-events.
+
+        Messages are appended to out (returned) when given."""
+        messages = out if out is not None else []
         timer_results = state.tick_timers()
 
         for name, value, msg in timer_results:
@@ -95,8 +184,8 @@ class EventManager:
                 if timer and timer.on_zero_event:
                     event = self.get_event(timer.on_zero_event)
                     if event:
-                        msgs = self._execute_actions(event.actions, state, world)
-                        messages.extend(msgs)
+                        self._execute_actions(event.actions, state, world,
+                                              messages)
                 state.disable_timer(name)
 
         return messages
@@ -107,62 +196,113 @@ class EventManager:
             state.register_timer(timer)
 
     def _execute_actions(self, actions: list[Action], state: GameState,
-                         world: World) -> list[str]:
-        messages: list[str] = []
+                         world: World,
+                         out: list[str] | None = None) -> list[str]:
+        """Run actions, appending any messages to out (returned)."""
+        messages = out if out is not None else []
 
         for action in actions:
-            at = action.type
+            handler = _ACTION_HANDLERS.get(action.type)
+            if handler is not None:
+                handler(action, state, world, messages)
 
-            if at == ActionType.MESSAGE:
-                messages.append(str(action.value))
+        return messages
 
-            elif at == ActionType.MOVE_ITEM:
-                world.move_item(action.target, str(action.value))
 
-            elif at == ActionType.SET_FLAG:
-                state.set_flag(action.target)
+def _message(action: Action, state: GameState, world: World,
+             out: list[str]) -> None:
+    out.append(str(action.value))
 
-            elif at == ActionType.CLEAR_FLAG:
-                state.clear_flag(action.target)
 
-            elif at == ActionType.INC_COUNTER:
-                state.inc_counter(action.target, int(action.value or 1))
+def _move_item(action: Action, state: GameState, world: World,
+               out: list[str]) -> None:
+    world.move_item(action.target, str(action.value))
 
-            elif at == ActionType.DEC_COUNTER:
-                state.dec_counter(action.target, int(action.value or 1))
 
-            elif at == ActionType.SET_COUNTER:
-                state.set_counter(action.target, int(action.value or 0))
+def _set_flag(action: Action, state: GameState, world: World,
+              out: list[str]) -> None:
+    state.set_flag(action.target)
 
-            elif at == ActionType.TELEPORT:
-                state.enter_room(action.target)
 
-            elif at == ActionType.ADD_SCORE:
-                state.add_score(int(action.value or 0))
+def _clear_flag(action: Action, state: GameState, world: World,
+                out: list[str]) -> None:
+    state.clear_flag(action.target)
 
-            elif at == ActionType.DESTROY_ITEM:
-                world.destroy_item(action.target)
 
-            elif at == ActionType.SWAP_ITEM:
-                # target = old item, value = new item ID
-                old_item = world.get_item(action.target)
-                if old_item:
-                    loc = old_item.location
-                    world.destroy_item(action.target)
-                    world.move_item(str(action.value), loc)
+def _inc_counter(action: Action, state: GameState, world: World,
+                 out: list[str]) -> None:
+    state.inc_counter(action.target, int(action.value or 1))
 
-            elif at == ActionType.UNLOCK_EXIT:
-                # target = flag to set (which exits check)
-                state.set_flag(action.target)
 
-            elif at == ActionType.GAME_OVER:
-                state.game_over = True
-                state.won = action.value == "win"
+def _dec_counter(action: Action, state: GameState, world: World,
+                 out: list[str]) -> None:
+    state.dec_counter(action.target, int(action.value or 1))
 
-            elif at == ActionType.ENABLE_TIMER:
-                state.enable_timer(action.target)
 
-            elif at == ActionType.DISABLE_TIMER:
-                state.disable_timer(action.target)
+def _set_counter(action: Action, state: GameState, world: World,
+                 out: list[str]) -> None:
+    state.set_counter(action.target, int(action.value or 0))
 
-        return messages
+
+def _teleport(action: Action, state: GameState, world: World,
+              out: list[str]) -> None:
+    state.enter_room(action.target)
+
+
+def _add_score(action: Action, state: GameState, world: World,
+               out: list[str]) -> None:
+    state.add_score(int(action.value or 0))
+
+
+def _destroy_item(action: Action, state: GameState, world: World,
+                  out: list[str]) -> None:
+    world.destroy_item(action.target)
+
+
+def _swap_item(action: Action, state: GameState, world: World,
+               out: list[str]) -> None:
+    # target = old item, value = new item ID
+    world.swap_item(action.target, str(action.value))
+
+
+def _unlock_exit(action: Action, state: GameState, world: World,
+                 out: list[str]) -> None:
+    # target = flag to set (which exits check)
+    state.set_flag(action.target)
+
+
+def _game_over(action: Action, state: GameState, world: World,
+               out: list[str]) -> None:
+    state.game_over = True
+    state.won = action.value == "win"
+
+
+def _enable_timer(action: Action, state: GameState, world: World,
+                  out: list[str]) -> None:
+    state.enable_timer(action.target)
+
+
+def _disable_timer(action: Action, state: GameState, world: World,
+                   out: list[str]) -> None:
+    state.disable_timer(action.target)
+
+
+_ACTION_HANDLERS: dict[ActionType,
+                       Callable[[Action, GameState, World, list[str]],
+                                None]] = {
+    ActionType.MESSAGE: _message,
+    ActionType.MOVE_ITEM: _move_item,
+    ActionType.SET_FLAG: _set_flag,
+    ActionType.CLEAR_FLAG: _clear_flag,
+    ActionType.INC_COUNTER: _inc_counter,
+    ActionType.DEC_COUNTER: _dec_counter,
+    ActionType.SET_COUNTER: _set_counter,
+    ActionType.TELEPORT: _teleport,
+    ActionType.ADD_SCORE: _add_score,
+    ActionType.DESTROY_ITEM: _destroy_item,
+    ActionType.SWAP_ITEM: _swap_item,
+    ActionType.UNLOCK_EXIT: _unlock_exit,
+    ActionType.GAME_OVER: _game_over,
+    ActionType.ENABLE_TIMER: _enable_timer,
+    ActionType.DISABLE_TIMER: _disable_timer,
+}
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import itertools
+import sys
 from dataclasses import dataclass, field
+from engine import jsonio
 from engine.types import Timer
 
+# Source of flag_version stamps, shared by all GameState instances so a
+# stamp never matches one taken from a different state.
+_versions = itertools.count()
+
 
 @dataclass
 class GameState:
@@ -12,23 +19,46 @@ class GameState:
     score: int = 0
     turns: int = 0
     max_score: int = 0
-    flags: dict[str, bool] = field(default_factory=dict)
+    flags: set[str] = field(default_factory=set)
     counters: dict[str, int] = field(default_factory=dict)
     visited: set[str] = field(default_factory=set)
     timers: dict[str, Timer] = field(default_factory=dict)
     game_over: bool = False
     won: bool = False
+    # Changes whenever the set of flags changes (see World.version)
+    flag_version: int = field(default_factory=lambda: next(_versions),
+                              repr=False, compare=False)
+    # The active timers, in registration order; kept in step with
+    # Timer.active by the timer methods so ticks skip idle timers
+    active_timers: list[Timer] = field(init=False, repr=False,
+                                       compare=False)
+    # Rooms whose auto events are all once-only and have all fired (see
+    # EventManager.run_auto_events); emptied whenever a flag is cleared
+    auto_done: set[str] = field(default_factory=set, repr=False,
+                                compare=False)
+
+    def __post_init__(self) -> None:
+        # Room IDs are interned (as World's keys are), so the first-visit
+        # check in enter_room is an identity comparison
+        self.current_room = sys.intern(self.current_room)
+        self.visited = {sys.intern(r) for r in self.visited}
+        self._sync_timers()
 
     # --- flags ---
 
     def set_flag(self, name: str) -> None:
-        self.flags[name] = True
+        if name not in self.flags:
+            self.flags.add(name)
+            self.flag_version = next(_versions)
 
     def clear_flag(self, name: str) -> None:
-        self.flags[name] = False
+        if name in self.flags:
+            self.flags.discard(name)
+            self.flag_version = next(_versions)
+            self.auto_done.clear()
 
     def flag_is_set(self, name: str) -> bool:
-        return self.flags.get(name, False)
+        return name in self.flags
 
     # --- counters ---
 
@@ -48,6 +78,7 @@ class GameState:
 
     def enter_room(self, room_id: str) -> bool:
         """Move to room, return True if first visit."""
+        room_id = sys.intern(room_id)
         self.current_room = room_id
         first = room_id not in self.visited
         self.visited.add(room_id)
@@ -60,56 +91,82 @@ class GameState:
 
     # --- timers ---
 
+    def _sync_timers(self) -> None:
+        self.active_timers = [t for t in self.timers.values() if t.active]
+
     def register_timer(self, timer: Timer) -> None:
         self.timers[timer.name] = timer
+        self._sync_timers()
 
     def enable_timer(self, name: str) -> None:
-        if name in self.timers:
-            self.timers[name].active = True
+        timer = self.timers.get(name)
+        if timer is not None and not timer.active:
+            timer.active = True
+            self._sync_timers()
 
     def disable_timer(self, name: str) -> None:
-        if name in self.timers:
-            self.timers[name].active = False
+        timer = self.timers.get(name)
+        if timer is not None and timer.active:
+            timer.active = False
+            self._sync_timers()
 
     def tick_timers(self) -> list[tuple[str, int, str]]:
         """Advance all active timers. Returns list of (name, value, message)
         for timers that ticked, plus any that hit zero."""
         results: list[tuple[str, int, str]] = []
-        for timer in self.timers.values():
-            if not timer.active:
-                continue
-            self.dec_counter(timer.counter)
-            val = self.get_counter(timer.counter)
+        counters = self.counters
+        for timer in self.active_timers:
+            key = timer.counter
+            val = counters.get(key, 0) - 1
+            counters[key] = val
             msg = ""
-            if timer.message_template and val > 0:
-                msg = timer.message_template.replace("{value}", str(val))
+            if val > 0 and timer.message_parts is not None:
+                msg = str(val).join(timer.message_parts)
             results.append((timer.name, val, msg))
         return results
 
     # --- serialization helpers ---
 
     def to_dict(self) -> dict:
+        """Serializable snapshot; flags and visited are sorted lists."""
         return {
             "current_room": self.current_room,
             "score": self.score,
             "turns": self.turns,
-            "flags": dict(self.flags),
+            "flags": sorted(self.flags),
             "counters": dict(self.counters),
-            "visited": list(self.visited),
-            "active_timers": [n for n, t in self.timers.items() if t.active],
+            "visited": sorted(self.visited),
+            "active_timers": [t.name for t in self.active_timers],
             "game_over": self.game_over,
             "won": self.won,
         }
 
+    def to_json(self) -> str:
+        """Encode the state as compact JSON."""
+        return jsonio.dumps(self.to_dict()).decode()
+
     def load_dict(self, data: dict) -> None:
-        self.current_room = data["current_room"]
+        """Restore a to_dict snapshot. The flag, counter and visited
+        containers are refilled in place, so references to them stay
+        valid; names are interned like those from the loader."""
+        self.current_room = sys.intern(data["current_room"])
         self.score = data["score"]
         self.turns = data["turns"]
-        self.flags = data["flags"]
-        self.counters = data["counters"]
-        self.visited = set(data["visited"])
+        flags = data["flags"]
+        if isinstance(flags, dict):  # older saves stored {name: bool}
+            flags = [name for name, value in flags.items() if value]
+        self.flags.clear()
+        self.flags.update(map(sys.intern, flags))
+        self.flag_version = next(_versions)
+        self.auto_done.clear()
+        self.counters.clear()
+        self.counters.update((sys.intern(name), value)
+                             for name, value in data["counters"].items())
+        self.visited.clear()
+        self.visited.update(map(sys.intern, data["visited"]))
         self.game_over = data.get("game_over", False)
         self.won = data.get("won", False)
         for name in data.get("active_timers", []):
             if name in self.timers:
                 self.timers[name].active = True
+        self._sync_timers()
@@ -0,0 +1,40 @@
+"""JSON encoding and decoding, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+
+def json_default(obj):
+    """JSON encoder hook: sets are written as lists."""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} "
+                    f"is not JSON serializable")
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON: compact, or indented by 2 if pretty."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else None
+        return orjson.dumps(obj, default=json_default, option=option)
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False,
+                          default=json_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False,
+                          default=json_default)
+    return text.encode()
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON; raises ValueError on malformed input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
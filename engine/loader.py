@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import os
+import sys
 from pathlib import Path
 
+from engine import jsonio
 from engine.types import (
     Action, ActionType, Condition, ConditionType, Direction, Event, Exit,
-    Item, Manifest, Timer, Vocabulary,
+    INVENTORY, NOWHERE, Item, Manifest, Timer, Vocabulary,
 )
 from engine.world import Room
 
 
+# Identifiers (room/item IDs, flags, verbs, nouns) are interned at parse time
+# so the dict lookups in GameState/World/EventManager compare by identity.
+def _intern(s: str | None) -> str | None:
+    return None if s is None else sys.intern(s)
+
+
+def _intern_synonyms(table: dict[str, str]) -> dict[str, str]:
+    return {sys.intern(k): sys.intern(v) for k, v in table.items()}
+
+
 def _load_json(path: Path) -> dict | list:
-    with open(path) as f:
-        return json.load(f)
+    """Decoded contents of path, memoized on the file's mtime and size.
+
+    The result is shared between calls and must not be mutated; the
+    _parse_* helpers only read it and build fresh objects each time."""
+    st = path.stat()
+    return _decode_json(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_json(path: Path, mtime_ns: int, size: int) -> dict | list:
+    return jsonio.loads(path.read_bytes())
 
 
 def _parse_direction(s: str) -> Direction:
@@ -24,16 +46,16 @@ def _parse_direction(s: str) -> Direction:
 def _parse_exit(data: dict) -> Exit:
     return Exit(
         direction=_parse_direction(data["direction"]),
-        destination=data["destination"],
+        destination=sys.intern(data["destination"]),
         locked=data.get("locked", False),
-        lock_flag=data.get("lock_flag"),
+        lock_flag=_intern(data.get("lock_flag")),
         lock_message=data.get("lock_message", "The way is blocked."),
     )
 
 
 def _parse_room(data: dict) -> Room:
     return Room(
-        id=data["id"],
+        id=sys.intern(data["id"]),
         name=data["name"],
         description=data["description"],
         exits=[_parse_exit(e) for e in data.get("exits", [])],
@@ -41,22 +63,22 @@ def _parse_room(data: dict) -> Room:
         dark_description=data.get("dark_description",
                                   "It's pitch black. You can't see a thing."),
         first_visit_text=data.get("first_visit_text"),
-        visit_flag=data.get("visit_flag"),
+        visit_flag=_intern(data.get("visit_flag")),
     )
 
 
 def _parse_item(data: dict) -> Item:
     return Item(
-        id=data["id"],
+        id=sys.intern(data["id"]),
         name=data["name"],
         description=data["description"],
         room_description=data.get("room_description", ""),
-        location=data.get("location", "__nowhere__"),
+        location=data.get("location", NOWHERE),
         takeable=data.get("takeable", True),
         weight=data.get("weight", 1),
-        aliases=data.get("aliases", []),
-        combine_with=data.get("combine_with"),
-        combine_result=data.get("combine_result"),
+        aliases=[sys.intern(a) for a in data.get("aliases", [])],
+        combine_with=_intern(data.get("combine_with")),
+        combine_result=_intern(data.get("combine_result")),
         combine_message=data.get("combine_message"),
     )
 
@@ -64,7 +86,7 @@ def _parse_item(data: dict) -> Item:
 def _parse_condition(data: dict) -> Condition:
     return Condition(
         type=ConditionType(data["type"]),
-        target=data["target"],
+        target=sys.intern(data["target"]),
         value=data.get("value"),
     )
 
@@ -72,17 +94,17 @@ def _parse_condition(data: dict) -> Condition:
 def _parse_action(data: dict) -> Action:
     return Action(
         type=ActionType(data["type"]),
-        target=data.get("target", ""),
+        target=sys.intern(data.get("target", "")),
         value=data.get("value"),
     )
 
 
 def _parse_event(data: dict) -> Event:
     return Event(
-        id=data["id"],
-        verb=data.get("verb"),
-        noun=data.get("noun"),
-        room=data.get("room"),
+        id=sys.intern(data["id"]),
+        verb=_intern(data.get("verb")),
+        noun=_intern(data.get("noun")),
+        room=_intern(data.get("room")),
         conditions=[_parse_condition(c) for c in data.get("conditions", [])],
         actions=[_parse_action(a) for a in data.get("actions", [])],
         override_builtin=data.get("override_builtin", True),
@@ -93,53 +115,93 @@ def _parse_event(data: dict) -> Event:
 
 def _parse_timer(data: dict) -> Timer:
     return Timer(
-        name=data["name"],
-        counter=data["counter"],
+        name=sys.intern(data["name"]),
+        counter=sys.intern(data["counter"]),
         interval=data.get("interval", 1),
-        on_zero_event=data.get("on_zero_event", ""),
+        on_zero_event=sys.intern(data.get("on_zero_event", "")),
         message_template=data.get("message_template", ""),
         active=data.get("active", False),
     )
 
 
-def load_manifest(data_dir: Path) -> Manifest:
-    data = _load_json(data_dir / "manifest.json")
+def _build_manifest(data: dict) -> Manifest:
     return Manifest(
         title=data.get("title", "Untitled Adventure"),
         author=data.get("author", "Unknown"),
         version=data.get("version", "1.0"),
         max_score=data.get("max_score", 0),
         max_inventory=data.get("max_inventory", 10),
-        start_room=data["start_room"],
+        start_room=sys.intern(data["start_room"]),
         intro_file=data.get("intro_file", "intro.txt"),
         help_file=data.get("help_file", "help.txt"),
     )
 
 
+def _build_events(data: dict) -> tuple[list[Event], list[Timer]]:
+    events = [_parse_event(e) for e in data.get("events", [])]
+    timers = [_parse_timer(t) for t in data.get("timers", [])]
+    return events, timers
+
+
+def _build_vocabulary(data: dict) -> Vocabulary:
+    return Vocabulary(
+        verb_synonyms=_intern_synonyms(data.get("verb_synonyms", {})),
+        noun_synonyms=_intern_synonyms(data.get("noun_synonyms", {})),
+        direction_synonyms=_intern_synonyms(
+            data.get("direction_synonyms", {})),
+    )
+
+
+def load_manifest(data_dir: Path) -> Manifest:
+    return _build_manifest(_load_json(data_dir / "manifest.json"))
+
+
 def load_rooms(data_dir: Path) -> list[Room]:
-    data = _load_json(data_dir / "rooms.json")
-    return [_parse_room(r) for r in data]
+    return [_parse_room(r) for r in _load_json(data_dir / "rooms.json")]
 
 
 def load_items(data_dir: Path) -> list[Item]:
-    data = _load_json(data_dir / "items.json")
-    return [_parse_item(i) for i in data]
+    return [_parse_item(i) for i in _load_json(data_dir / "items.json")]
 
 
 def load_events(data_dir: Path) -> tuple[list[Event], list[Timer]]:
-    data = _load_json(data_dir / "events.json")
-    events = [_parse_event(e) for e in data.get("events", [])]
-    timers = [_parse_timer(t) for t in data.get("timers", [])]
-    return events, timers
+    return _build_events(_load_json(data_dir / "events.json"))
 
 
 def load_vocabulary(data_dir: Path) -> Vocabulary:
-    data = _load_json(data_dir / "vocabulary.json")
-    return Vocabulary(
-        verb_synonyms=data.get("verb_synonyms", {}),
-        noun_synonyms=data.get("noun_synonyms", {}),
-        direction_synonyms=data.get("direction_synonyms", {}),
-    )
+    return _build_vocabulary(_load_json(data_dir / "vocabulary.json"))
+
+
+GameData = tuple[Manifest, list[Room], list[Item], list[Event], list[Timer],
+                 Vocabulary]
+
+# Data files read by load_all
+DATA_FILES = ("manifest.json", "rooms.json", "items.json", "events.json",
+              "vocabulary.json")
+
+
+def load_all(data_dir: Path) -> GameData:
+    """Return (manifest, rooms, items, events, timers, vocabulary).
+
+    One directory scan finds the data files and each is read once; a
+    missing file raises FileNotFoundError, as the load_* functions do."""
+    with os.scandir(data_dir) as entries:
+        found = {e.name: e for e in entries if e.name in DATA_FILES}
+    for name in DATA_FILES:
+        if name not in found:
+            raise FileNotFoundError(f"No such file: '{data_dir / name}'")
+    raw = {}
+    for name, entry in found.items():
+        # The scan already has the stat, so skip _load_json's own
+        st = entry.stat()
+        raw[name] = _decode_json(Path(entry.path), st.st_mtime_ns,
+                                 st.st_size)
+    events, timers = _build_events(raw["events.json"])
+    return (_build_manifest(raw["manifest.json"]),
+            [_parse_room(r) for r in raw["rooms.json"]],
+            [_parse_item(i) for i in raw["items.json"]],
+            events, timers,
+            _build_vocabulary(raw["vocabulary.json"]))
 
 
 def load_text_file(data_dir: Path, filename: str) -> str:
@@ -165,7 +227,7 @@ def validate_world(rooms: list[Room], items: list[Item],
 
     for item in items:
         loc = item.location
-        if loc not in room_ids and loc not in ("__inventory__", "__nowhere__"):
+        if loc not in room_ids and loc not in (INVENTORY, NOWHERE):
             errors.append(
                 f"Item '{item.id}' has unknown location '{loc}'")
 
@@ -2,40 +2,71 @@
 
 from __future__ import annotations
 
-from engine.types import Direction, ParsedCommand, Vocabulary
+import sys
+from types import MappingProxyType
+from typing import Callable, Mapping
 
-# Directions that can be typed as bare commands
-_DIRECTION_WORDS = {d.value for d in Direction}
+from engine.types import ParsedCommand, Vocabulary
+
+# Vocabulary.words entry for a word that is no kind of synonym
+_NO_MATCH: tuple[None, None, None] = (None, None, None)
+
+# Parse cache size; the cache is emptied when it grows past this
+_CACHE_LIMIT = 512
 
 
 class Parser:
-    def __init__(self, vocabulary: Vocabulary) -> None:
+    def __init__(self, vocabulary: Vocabulary,
+                 handlers: Mapping[str, Callable] | None = None) -> None:
         self.vocabulary = vocabulary
+        # Read-only snapshots, so a parse depends only on the raw input
+        self._words = MappingProxyType(dict(vocabulary.words))
+        # verb -> built-in handler, attached to each ParsedCommand
+        self._handlers = MappingProxyType(dict(handlers or {}))
+        # raw input -> result. Commands are shared between hits, so
+        # callers must treat them as read-only.
+        self._cache: dict[str, ParsedCommand | None] = {}
+
+    # The _resolve_* helpers expect words already lower-cased by parse().
+    # Each is a single probe of the vocabulary's word table.
 
     def _resolve_direction(self, word: str) -> str | None:
-        word = word.lower()
-        if word in _DIRECTION_WORDS:
-            return word
-        return self.vocabulary.direction_synonyms.get(word)
+        return self._words.get(word, _NO_MATCH)[2]
 
     def _resolve_verb(self, word: str) -> str:
-        word = word.lower()
-        return self.vocabulary.verb_synonyms.get(word, word)
+        verb = self._words.get(word, _NO_MATCH)[0]
+        return verb if verb is not None else sys.intern(word)
+
+    def _canonical_noun(self, word: str) -> str | None:
+        return self._words.get(word, _NO_MATCH)[1]
 
     def _resolve_noun(self, word: str) -> str:
-        word = word.lower()
-        resolved = self.vocabulary.noun_synonyms.get(word)
+        resolved = self._canonical_noun(word)
         if resolved:
             return resolved
         # Handle "X with Y" patterns (e.g., "combine cell with adapter")
-        if " with " in word:
-            left, right = word.split(" with ", 1)
-            left = self.vocabulary.noun_synonyms.get(left.strip(), left.strip())
-            right = self.vocabulary.noun_synonyms.get(right.strip(), right.strip())
-            return f"{left} with {right}"
-        return word
+        left, sep, right = word.partition(" with ")
+        if sep:
+            left, right = left.strip(), right.strip()
+            left = self._canonical_noun(left) or left
+            right = self._canonical_noun(right) or right
+            return sys.intern(f"{left} with {right}")
+        return sys.intern(word)
 
     def parse(self, raw_input: str) -> ParsedCommand | None:
+        try:
+            return self._cache[raw_input]
+        except KeyError:
+            pass
+        cmd = self._parse(raw_input)
+        if cmd is not None:
+            cmd.handler = self._handlers.get(cmd.verb)
+        if len(self._cache) >= _CACHE_LIMIT:
+            self._cache.clear()
+        self._cache[raw_input] = cmd
+        return cmd
+
+    def _parse(self, raw_input: str) -> ParsedCommand | None:
         raw = raw_input.strip()
         if not raw:
             return None
@@ -44,7 +75,7 @@ class Parser:
 
         # Single word: might be a direction shortcut
         if len(parts) == 1:
-            direction = self._resolve_direction(parts[0])
+            verb, _, direction = self._words.get(parts[0], _NO_MATCH)
             if direction is not None:
                 return ParsedCommand(
                     raw=raw,
@@ -54,7 +85,8 @@ class Parser:
                     original_noun=parts[0],
                 )
             # Single-word verb (LOOK, INVENTORY, HELP, etc.)
-            verb = self._resolve_verb(parts[0])
+            if verb is None:
+                verb = sys.intern(parts[0])
             return ParsedCommand(
                 raw=raw,
                 verb=verb,
@@ -1,45 +1,114 @@
-"""Save/load game state to JSON."""
+"""Save/load game state to JSON (or msgpack, if installed)."""
 
 from __future__ import annotations
 
-import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 
+from engine import jsonio
 from engine.game_state import GameState
+from engine.jsonio import json_default
 from engine.world import World
 from engine.types import ItemLocation
 
+try:
+    import msgpack
+except ImportError:  # optional; only needed for .msgpack save files
+    msgpack = None
+
 SAVE_FILE = "savegame.json"
+SAVE_VERSION = 2  # 1 = no "version" key
+MSGPACK_SUFFIX = ".msgpack"
+
+
+def _file_mode(path: Path) -> int:
+    """Mode for a rewritten path: its current mode, or what open() would
+    give a new file under the process umask."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_atomic(path: Path, buf: bytes) -> None:
+    """Write buf to a temp file beside path, then rename it over path, so
+    a failed save never leaves a truncated file behind."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name,
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp creates the file 0600; give it the mode a save
+            # should have
+            os.chmod(tmp_name, _file_mode(path))
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def save_game(state: GameState, world: World,
-              filepath: str = SAVE_FILE) -> str:
-    """Save current game state. Returns status message."""
+              filepath: str | Path = SAVE_FILE,
+              pretty: bool = False) -> str:
+    """Save current game state. Returns status message.
+
+    Saves are written as compact JSON; pretty=True indents them for
+    reading by hand. A filepath ending in .msgpack is written as msgpack
+    instead, which needs the msgpack package."""
     item_locations = {item_id: item.location
                       for item_id, item in world.items.items()}
     data = {
+        "version": SAVE_VERSION,
         "state": state.to_dict(),
         "item_locations": item_locations,
     }
+    path = Path(filepath)
     try:
-        Path(filepath).write_text(json.dumps(data, indent=2))
+        if path.suffix == MSGPACK_SUFFIX:
+            if msgpack is None:
+                return "Error saving game: msgpack is not installed."
+            buf = msgpack.packb(data, use_bin_type=True,
+                                default=json_default)
+        else:
+            buf = jsonio.dumps(data, pretty)
+        _write_atomic(path, buf)
         return f"Game saved to {filepath}."
     except OSError as e:
         return f"Error saving game: {e}"
 
 
 def load_game(state: GameState, world: World,
-              filepath: str = SAVE_FILE) -> str:
-    """Load game state from file. Returns status message."""
+              filepath: str | Path = SAVE_FILE) -> str:
+    """Load game state from file. Returns status message.
+
+    As in save_game, a filepath ending in .msgpack is read as msgpack and
+    anything else as JSON. Saves from a newer SAVE_VERSION are refused."""
     path = Path(filepath)
     if not path.exists():
         return "No save file found."
     try:
-        data = json.loads(path.read_text())
+        raw = path.read_bytes()
+        if path.suffix == MSGPACK_SUFFIX:
+            if msgpack is None:
+                return "Error loading save: msgpack is not installed."
+            data = msgpack.unpackb(raw, raw=False)
+        else:
+            data = jsonio.loads(raw)
+        if not isinstance(data, dict):
+            return "Error loading save: not a save file."
+        version = data.get("version", 1)
+        if not isinstance(version, int) or version > SAVE_VERSION:
+            return (f"Error loading save: format version {version} is newer "
+                    f"than this game supports ({SAVE_VERSION}).")
         state.load_dict(data["state"])
         for item_id, location in data["item_locations"].items():
-            if item_id in world.items:
-                world.items[item_id].location = location
+            world.move_item(item_id, location)
         return "Game loaded."
-    except (json.JSONDecodeError, KeyError, OSError) as e:
+    except (ValueError, KeyError, TypeError, OSError) as e:
         return f"Error loading save: {e}"
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import Any, Callable
 
 
 class Direction(Enum):
@@ -22,16 +23,26 @@ class ItemLocation(Enum):
     NOWHERE = "__nowhere__"
 
 
-@dataclass
+# Interned plain-string forms of the special locations. Item.location is
+# always a str, so hot paths compare against these rather than the enum.
+INVENTORY = sys.intern(ItemLocation.INVENTORY.value)
+NOWHERE = sys.intern(ItemLocation.NOWHERE.value)
+
+
+@dataclass(slots=True)
 class Exit:
     direction: Direction
     destination: str  # room ID
     locked: bool = False
     lock_flag: str | None = None  # flag that must be set to unlock
     lock_message: str = "The way is blocked."
+    label: str = field(init=False, repr=False, compare=False)  # "North"
+
+    def __post_init__(self) -> None:
+        self.label = self.direction.value.capitalize()
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     id: str
     name: str
@@ -41,9 +52,22 @@ class Room:
     dark_description: str = "It's pitch black. You can't see a thing."
     first_visit_text: str | None = None
     visit_flag: str | None = None  # flag set on first visit
-
-
-@dataclass
+    # Built by World from exits
+    exits_by_dir: dict[Direction, Exit] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    header: str = field(init=False, repr=False, compare=False)
+    # (locked state of each exit, "Exits: ..." line) from the last describe
+    exit_label_cache: tuple[tuple[bool, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False)
+    # ((first_visit, world.version, state.flag_version), messages)
+    describe_cache: tuple[tuple[bool, int, int], list[str]] | None = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.header = f"\n--- {self.name} ---"
+
+
+@dataclass(slots=True)
 class Item:
     id: str
     name: str
@@ -57,6 +81,9 @@ class Item:
     combine_result: str | None = None  # item ID produced by combination
     combine_message: str | None = None
 
+    def __post_init__(self) -> None:
+        self.location = sys.intern(self.location)
+
 
 class ConditionType(Enum):
     CARRYING = "carrying"           # player has item
@@ -73,7 +100,7 @@ class ConditionType(Enum):
     NOT_IN_ROOM = "not_in_room"
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     type: ConditionType
     target: str  # item ID, flag name, room ID, or counter name
@@ -98,14 +125,14 @@ class ActionType(Enum):
     DISABLE_TIMER = "disable_timer"
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     type: ActionType
     target: str = ""       # item ID, flag name, room ID, counter name, etc.
     value: Any = None      # text, number, destination, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     id: str
     verb: str | None = None        # None = auto-event (runs every turn)
@@ -116,9 +143,22 @@ class Event:
     override_builtin: bool = True  # if True, skip built-in action for this verb
     once: bool = False             # if True, only fires once (uses flag "event_{id}_done")
     priority: int = 0              # higher = checked first
-
-
-@dataclass
+    done_flag: str = field(init=False, repr=False, compare=False)
+    # conditions in evaluation order; EventManager puts cheap checks first
+    ordered_conditions: list[Condition] = field(init=False, repr=False,
+                                                compare=False)
+    # ordered_conditions compiled into a predicate by EventManager (a
+    # closure, so registered events cannot be pickled)
+    guard: Callable[..., bool] | None = field(init=False, repr=False,
+                                              compare=False)
+
+    def __post_init__(self) -> None:
+        self.done_flag = sys.intern(f"event_{self.id}_done")
+        self.ordered_conditions = self.conditions
+        self.guard = None
+
+
+@dataclass(slots=True)
 class Timer:
     name: str
     counter: str           # counter name to decrement
@@ -126,16 +166,38 @@ class Timer:
     on_zero_event: str = ""  # event ID to fire when counter hits 0
     message_template: str = ""  # per-tick message, {value} placeholder
     active: bool = False
+    # message_template split around "{value}", or None when there is no
+    # template; str(value).join(parts) fills it in. Other braces are text.
+    message_parts: list[str] | None = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.message_parts = (self.message_template.split("{value}")
+                              if self.message_template else None)
 
 
-@dataclass
+@dataclass(slots=True)
 class Vocabulary:
     verb_synonyms: dict[str, str] = field(default_factory=dict)   # synonym -> canonical
     noun_synonyms: dict[str, str] = field(default_factory=dict)
     direction_synonyms: dict[str, str] = field(default_factory=dict)
-
-
-@dataclass
+    # word -> (verb, noun, direction) canonical forms, None where the word
+    # is not that kind of synonym; bare direction names map to themselves
+    words: dict[str, tuple[str | None, str | None, str | None]] = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        words: dict[str, list[str | None]] = {}
+        for slot, table in enumerate((self.verb_synonyms, self.noun_synonyms,
+                                      self.direction_synonyms)):
+            for word, canonical in table.items():
+                words.setdefault(word, [None, None, None])[slot] = canonical
+        for d in Direction:
+            words.setdefault(d.value, [None, None, None])[2] = d.value
+        self.words = {w: tuple(entry) for w, entry in words.items()}
+
+
+@dataclass(slots=True)
 class Manifest:
     title: str = "Untitled Adventure"
     author: str = "Unknown"
@@ -147,10 +209,11 @@ class Manifest:
     help_file: str = "help.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedCommand:
     raw: str
     verb: str
     noun: str | None = None
     original_verb: str = ""
     original_noun: str | None = None
+    handler: Any = field(default=None, repr=False, compare=False)  # built-in
@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
-from engine.types import Direction, Exit, Item, ItemLocation, Room
+import itertools
+import sys
+
+from engine.types import INVENTORY, NOWHERE, Direction, Exit, Item, Room
+
+# Source of World.version stamps, shared by all World instances
+_versions = itertools.count()
 
 
 class World:
     def __init__(self, rooms: list[Room], items: list[Item]) -> None:
-        self.rooms: dict[str, Room] = {r.id: r for r in rooms}
-        self.items: dict[str, Item] = {i.id: i for i in items}
+        # Changes on every item move; lets room descriptions be cached
+        self.version = next(_versions)
+        # Keys are interned so probes with interned IDs (current_room, exit
+        # destinations) compare by identity
+        self.rooms: dict[str, Room] = {sys.intern(r.id): r for r in rooms}
+        for room in rooms:
+            # Reversed so the first exit listed for a direction wins
+            room.exits_by_dir = {e.direction: e
+                                 for e in reversed(room.exits)}
+        self.items: dict[str, Item] = {sys.intern(i.id): i for i in items}
         # Build noun -> item_id lookup (includes aliases)
         self._noun_index: dict[str, list[str]] = {}
         for item in items:
             for name in [item.id] + item.aliases:
-                self._noun_index.setdefault(name, []).append(item.id)
+                key = sys.intern(name.lower())
+                self._noun_index.setdefault(key, []).append(item.id)
+        # location (room ID, INVENTORY or NOWHERE) -> IDs of items there;
+        # kept in sync by move_item
+        self._by_location: dict[str, set[str]] = {}
+        for item in items:
+            self._by_location.setdefault(item.location, set()).add(item.id)
+        # Catalog position, so listings keep the items.json order
+        self._order: dict[str, int] = {i.id: n for n, i in enumerate(items)}
 
     def get_room(self, room_id: str) -> Room | None:
         return self.rooms.get(room_id)
@@ -21,27 +43,67 @@ class World:
     def get_item(self, item_id: str) -> Item | None:
         return self.items.get(item_id)
 
+    def item_location(self, item_id: str) -> str:
+        """Location of an item; unknown items count as NOWHERE."""
+        item = self.items.get(item_id)
+        if item is None:
+            return NOWHERE
+        return item.location
+
+    def is_at(self, item_id: str, location: str) -> bool:
+        """True if the item is at location (one lookup in the index)."""
+        here = self._by_location.get(location)
+        return here is not None and item_id in here
+
     def find_exit(self, room: Room, direction: Direction) -> Exit | None:
-        for ex in room.exits:
-            if ex.direction == direction:
-                return ex
-        return None
+        return room.exits_by_dir.get(direction)
 
     def items_in_room(self, room_id: str) -> list[Item]:
-        return [i for i in self.items.values() if i.location == room_id]
+        item_ids = self._by_location.get(room_id)
+        if not item_ids:
+            return []
+        if len(item_ids) > 1:
+            last = len(self._order)
+            item_ids = sorted(item_ids, key=lambda i: self._order.get(i, last))
+        return [self.items[i] for i in item_ids]
 
     def items_in_inventory(self) -> list[Item]:
-        return [i for i in self.items.values()
-                if i.location == ItemLocation.INVENTORY.value]
+        return self.items_in_room(INVENTORY)
 
     def resolve_noun_to_items(self, noun: str) -> list[Item]:
         """Resolve a noun to matching items (may return multiple)."""
         item_ids = self._noun_index.get(noun, [])
         return [self.items[iid] for iid in item_ids if iid in self.items]
 
+    def find_item(self, noun: str, *locations: str) -> Item | None:
+        """Return the first item, in catalog order, matching noun that is
+        at one of locations."""
+        for iid in self._noun_index.get(noun, ()):
+            item = self.items.get(iid)
+            if item is not None and item.location in locations:
+                return item
+        return None
+
     def move_item(self, item_id: str, location: str) -> None:
-        if item_id in self.items:
-            self.items[item_id].location = location
+        item = self.items.get(item_id)
+        if item is None:
+            return
+        old = self._by_location.get(item.location)
+        if old is not None:
+            old.discard(item_id)
+        location = sys.intern(location)
+        self._by_location.setdefault(location, set()).add(item_id)
+        item.location = location
+        self.version = next(_versions)
 
     def destroy_item(self, item_id: str) -> None:
-        self.move_item(item_id, ItemLocation.NOWHERE.value)
+        self.move_item(item_id, NOWHERE)
+
+    def swap_item(self, old_id: str, new_id: str) -> None:
+        """Put new_id where old_id is and remove old_id from play."""
+        old = self.items.get(old_id)
+        if old is None:
+            return
+        location = old.location
+        self.move_item(old_id, NOWHERE)
+        self.move_item(new_id, location)
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Generate an SVG map of Void Station Omega. No dependencies beyond stdlib."""
 
+import argparse
 import json
 from pathlib import Path
 
@@ -105,6 +106,39 @@ DIR_LABEL = {"north": "N", "south": "S", "east": "E", "west": "W",
              "up": "U", "down": "D"}
 
 
+def _build_room_info():
+    """Resolve position, colours and label lines for every room once."""
+    info = {}
+    for room_id, (cx, cy) in POSITIONS.items():
+        colors = DECK_COLORS[ROOM_DECK[room_id]]
+        sp = SPECIAL.get(room_id, {})
+        info[room_id] = (
+            cx, cy,
+            sp.get("fill", colors["fill"]),
+            sp.get("stroke", colors["stroke"]),
+            sp.get("pw", 1.5),
+            colors["text"],
+            tuple(DISPLAY_NAMES.get(room_id, room_id).split("\n")),
+        )
+    return info
+
+
+# room_id -> (cx, cy, fill, stroke, stroke_width, text_color, label_lines)
+ROOM_INFO = _build_room_info()
+
+# SVG element templates, filled with str.format_map
+ROOM_RECT_TMPL = ('<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="6" '
+                  'fill="{fill}" stroke="{stroke}" stroke-width="{pw}"/>')
+ROOM_TEXT_TMPL = ('<text x="{x}" y="{y}" text-anchor="middle" fill="{fill}" '
+                  'font-size="{size}" font-family="Helvetica,sans-serif">'
+                  '{text}</text>')
+EDGE_TMPL = ('<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+             'stroke="{color}" stroke-width="{pw}"{extra}/>')
+EDGE_LABEL_TMPL = ('<text x="{x}" y="{y}" text-anchor="middle" '
+                   'fill="{color}" font-size="7" opacity="0.8" '
+                   'font-family="Helvetica,sans-serif">{text}</text>')
+
+
 def edge_point(cx, cy, direction):
     if direction in ("north", "up"):
         return cx, cy - RH // 2
@@ -118,29 +152,21 @@ def edge_point(cx, cy, direction):
 
 
 def svg_room(room_id):
-    cx, cy = POSITIONS[room_id]
-    deck = ROOM_DECK[room_id]
-    colors = DECK_COLORS[deck]
-    sp = SPECIAL.get(room_id, {})
-    fill = sp.get("fill", colors["fill"])
-    stroke = sp.get("stroke", colors["stroke"])
-    pw = sp.get("pw", 1.5)
-    tc = colors["text"]
+    cx, cy, fill, stroke, pw, tc, lines = ROOM_INFO[room_id]
     x, y = cx - RW // 2, cy - RH // 2
-    lines = DISPLAY_NAMES.get(room_id, room_id).split("\n")
 
-    s = [f'<rect x="{x}" y="{y}" width="{RW}" height="{RH}" '
-         f'rx="6" fill="{fill}" stroke="{stroke}" stroke-width="{pw}"/>']
+    s = [ROOM_RECT_TMPL.format_map({"x": x, "y": y, "w": RW, "h": RH,
+                                    "fill": fill, "stroke": stroke,
+                                    "pw": pw})]
     if len(lines) == 1:
-        s.append(f'<text x="{cx}" y="{cy + 4}" text-anchor="middle" '
-                 f'fill="{tc}" font-size="10" font-family="Helvetica,sans-serif">'
-                 f'{lines[0]}</text>')
+        s.append(ROOM_TEXT_TMPL.format_map({"x": cx, "y": cy + 4, "fill": tc,
+                                            "size": 10, "text": lines[0]}))
     else:
         ty = cy - 5 * (len(lines) - 1)
         for ln in lines:
-            s.append(f'<text x="{cx}" y="{ty + 4}" text-anchor="middle" '
-                     f'fill="{tc}" font-size="9" '
-                     f'font-family="Helvetica,sans-serif">{ln}</text>')
+            s.append(ROOM_TEXT_TMPL.format_map({"x": cx, "y": ty + 4,
+                                                "fill": tc, "size": 9,
+                                                "text": ln}))
             ty += 13
     return "\n    ".join(s)
 
@@ -165,24 +191,34 @@ def svg_edge(r1, direction, r2, locked, drawn):
         color = "#cc4444"
         extra = ' stroke-dasharray="6,4"'
 
-    s = [f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-         f'stroke="{color}" stroke-width="{pw}"{extra}/>']
+    s = [EDGE_TMPL.format_map({"x1": x1, "y1": y1, "x2": x2, "y2": y2,
+                               "color": color, "pw": pw, "extra": extra})]
 
     lbl = DIR_LABEL.get(direction, "")
     if lbl:
         mx, my = (x1 + x2) / 2, (y1 + y2) / 2
         ox = 8 if not vert else 8
         oy = -6 if vert else -6
-        s.append(f'<text x="{mx + ox}" y="{my + oy}" text-anchor="middle" '
-                 f'fill="{color}" font-size="7" opacity="0.8" '
-                 f'font-family="Helvetica,sans-serif">{lbl}</text>')
+        s.append(EDGE_LABEL_TMPL.format_map({"x": mx + ox, "y": my + oy,
+                                             "color": color, "text": lbl}))
 
     return "\n    ".join(s)
 
 
-def generate():
+def generate(force=False):
     data_dir = Path(__file__).parent / "game_data"
-    rooms_data = json.loads((data_dir / "rooms.json").read_text())
+    rooms_path = data_dir / "rooms.json"
+    out = Path(__file__).parent / "map.svg"
+
+    # The map only depends on rooms.json and this script
+    src_mtime = max(rooms_path.stat().st_mtime_ns,
+                    Path(__file__).stat().st_mtime_ns)
+    if (not force and out.exists()
+            and out.stat().st_mtime_ns >= src_mtime):
+        print(f"{out} is up to date")
+        return
+
+    rooms_data = json.loads(rooms_path.read_text())
 
     W, H = 920, 970
     svg = [
@@ -277,10 +313,12 @@ def generate():
 
     svg.append("</svg>")
 
-    out = Path(__file__).parent / "map.svg"
     out.write_text("\n".join(svg))
     print(f"Written to {out}")
 
 
 if __name__ == "__main__":
-    generate()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate even if map.svg is up to date")
+    generate(force=parser.parse_args().force)
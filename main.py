@@ -14,13 +14,14 @@ from engine.events import EventManager
 from engine.actions import BUILTIN_HANDLERS, handle_look
 from engine.display import Pager, print_messages, print_title, print_separator
 from engine.save import save_game, load_game
-from engine.loader import (
-    load_manifest, load_rooms, load_items, load_events,
-    load_vocabulary, load_text_file, validate_world,
-)
+from engine.loader import load_all, load_text_file, validate_world
 
 DEFAULT_DATA_DIR = Path(__file__).parent / "game_data"
 
+# Meta-commands (handled before parsing, not counted as turns)
+META_QUIT = frozenset({"quit", "exit", "q"})
+META_HELP = frozenset({"help", "?"})
+
 
 def run(input_fn=None, data_dir: Path | None = None) -> int:
     """Run the game. Returns final score. input_fn overrides input() for testing."""
@@ -32,11 +33,7 @@ def run(input_fn=None, data_dir: Path | None = None) -> int:
     pager = Pager(input_fn=input_fn, enabled=interactive)
 
     # Load game data
-    manifest = load_manifest(data_dir)
-    rooms = load_rooms(data_dir)
-    items = load_items(data_dir)
-    events, timers = load_events(data_dir)
-    vocabulary = load_vocabulary(data_dir)
+    manifest, rooms, items, events, timers, vocabulary = load_all(data_dir)
 
     # Validate
     errors = validate_world(rooms, items, events)
@@ -53,13 +50,13 @@ def run(input_fn=None, data_dir: Path | None = None) -> int:
         max_score=manifest.max_score,
     )
     state.visited.add(manifest.start_room)
-    parser = Parser(vocabulary)
+    parser = Parser(vocabulary, BUILTIN_HANDLERS)
     event_mgr = EventManager(events, timers)
     event_mgr.register_timers(state)
 
     # Intro
     intro = load_text_file(data_dir, manifest.intro_file)
-    help_text = load_text_file(data_dir, manifest.help_file)
+    help_text: str | None = None  # read on first HELP
 
     print_title(manifest.title, pager)
     if intro:
@@ -76,22 +73,29 @@ def run(input_fn=None, data_dir: Path | None = None) -> int:
     if auto_msgs:
         print_messages(auto_msgs, pager)
 
-    # Main loop
+    # Main loop. One message buffer is reused for every turn.
+    messages: list[str] = []
+    show_break = True
     while not state.game_over:
-        pager.write()
-        pager.reset()
+        # Blank line + new page before each prompt, unless the last input
+        # was empty and printed nothing
+        if show_break:
+            pager.write()
+            pager.reset()
+        show_break = True
         try:
             raw = input_fn("> ")
         except (EOFError, KeyboardInterrupt):
             print("\nGoodbye!")
             break
 
-        if not raw.strip():
+        lower = raw.strip().lower()
+        if not lower:
+            show_break = False
             continue
 
         # Meta-commands (not counted as turns)
-        lower = raw.strip().lower()
-        if lower in ("quit", "exit", "q"):
+        if lower in META_QUIT:
             pager.write("Thanks for playing! Final score: "
                         f"{state.score}/{state.max_score}")
             break
@@ -104,7 +108,9 @@ def run(input_fn=None, data_dir: Path | None = None) -> int:
             msgs = handle_look(look_cmd, state, world)
             print_messages(msgs, pager)
             continue
-        if lower in ("help", "?"):
+        if lower in META_HELP:
+            if help_text is None:
+                help_text = load_text_file(data_dir, manifest.help_file)
             if help_text:
                 pager.write(help_text)
             else:
@@ -120,33 +126,27 @@ def run(input_fn=None, data_dir: Path | None = None) -> int:
             continue
 
         state.turns += 1
-        messages: list[str] = []
+        messages.clear()
 
         # 1. Check command events (puzzle/story triggers)
-        handled, event_msgs = event_mgr.try_command_events(cmd, state, world)
-        messages.extend(event_msgs)
+        handled, _ = event_mgr.try_command_events(cmd, state, world, messages)
 
         # 2. If not handled by event, try built-in action
         if not handled:
-            handler = BUILTIN_HANDLERS.get(cmd.verb)
-            if handler:
-                msgs = handler(cmd, state, world)
+            if cmd.handler:
+                msgs = cmd.handler(cmd, state, world)
                 messages.extend(msgs)
             else:
                 messages.append(f"I don't know how to '{cmd.verb}'.")
 
-        # 3. Display results
-        print_messages(messages, pager)
+        # 3. Run auto-events (room-enter triggers, etc.)
+        event_mgr.run_auto_events(state, world, messages)
 
-        # 4. Run auto-events (room-enter triggers, etc.)
-        auto_msgs = event_mgr.run_auto_events(state, world)
-        if auto_msgs:
-            print_messages(auto_msgs, pager)
+        # 4. Tick timers
+        event_mgr.tick_timers(state, world, messages)
 
-        # 5. Tick timers
-        timer_msgs = event_mgr.tick_timers(state, world)
-        if timer_msgs:
-            print_messages(timer_msgs, pager)
+        # 5. Display results
+        print_messages(messages, pager)
 
         # 6. Check game over
         if state.game_over:
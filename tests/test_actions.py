@@ -0,0 +1,75 @@
+"""Tests for built-in action handlers."""
+
+import pytest
+from engine.actions import handle_examine, handle_look, handle_take
+from engine.game_state import GameState
+from engine.types import (
+    Direction, Exit, Item, ItemLocation, ParsedCommand, Room,
+)
+from engine.world import World
+
+
+@pytest.fixture
+def setup():
+    rooms = [
+        Room(id="room1", name="Room 1", description="A room.",
+             exits=[Exit(direction=Direction.NORTH, destination="room2",
+                         locked=True, lock_flag="door_open")]),
+        Room(id="room2", name="Room 2", description="Another room."),
+    ]
+    items = [
+        Item(id="key", name="key", description="A key.",
+             room_description="A key lies here.",
+             location=ItemLocation.INVENTORY.value),
+    ]
+    world = World(rooms, items)
+    state = GameState(current_room="room1")
+    return state, world
+
+
+LOOK = ParsedCommand(raw="look", verb="look")
+
+
+def test_look_describes_room(setup):
+    state, world = setup
+    msgs = handle_look(LOOK, state, world)
+    assert msgs == ["\n--- Room 1 ---", "A room.", "Exits: North (locked)"]
+
+
+def test_look_sees_dropped_item(setup):
+    state, world = setup
+    handle_look(LOOK, state, world)
+    world.move_item("key", "room1")
+    assert "A key lies here." in handle_look(LOOK, state, world)
+
+
+def test_look_sees_unlocked_exit(setup):
+    state, world = setup
+    handle_look(LOOK, state, world)
+    state.set_flag("door_open")
+    assert "Exits: North" in handle_look(LOOK, state, world)
+
+
+def test_look_result_is_not_shared(setup):
+    state, world = setup
+    handle_look(LOOK, state, world).append("extra")
+    assert "extra" not in handle_look(LOOK, state, world)
+
+
+def test_shared_alias_prefers_catalog_order():
+    # As in divine_intervention: the keycard is listed first and carried,
+    # the ship key also answers to "key" and lies in the room
+    rooms = [Room(id="chamber", name="Chamber", description="A room.")]
+    items = [
+        Item(id="keycard", name="keycard", description="A keycard.",
+             room_description="", location=ItemLocation.INVENTORY.value,
+             aliases=["key"]),
+        Item(id="ship_key", name="ship key", description="A ship key.",
+             room_description="", location="chamber", aliases=["key"]),
+    ]
+    world = World(rooms, items)
+    state = GameState(current_room="chamber")
+    cmd = ParsedCommand(raw="take key", verb="take", noun="key")
+    assert handle_take(cmd, state, world) == ["You already have that."]
+    cmd = ParsedCommand(raw="examine key", verb="examine", noun="key")
+    assert handle_examine(cmd, state, world) == ["A keycard."]
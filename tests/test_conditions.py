@@ -1,7 +1,9 @@
 """Tests for condition evaluator."""
 
 import pytest
-from engine.conditions import evaluate, evaluate_all
+from engine.conditions import (
+    compile_guard, evaluate, evaluate_all, order_by_cost,
+)
 from engine.types import Condition, ConditionType, Item, ItemLocation, Room
 from engine.game_state import GameState
 from engine.world import World
@@ -139,3 +141,35 @@ def test_evaluate_all_false(setup):
 def test_evaluate_all_empty(setup):
     state, world = setup
     assert evaluate_all([], state, world) is True
+
+
+def test_order_by_cost():
+    carrying = Condition(type=ConditionType.CARRYING, target="sword")
+    flag = Condition(type=ConditionType.FLAG_SET, target="door_open")
+    here = Condition(type=ConditionType.HERE, target="key")
+    room = Condition(type=ConditionType.IN_ROOM, target="room1")
+    assert order_by_cost([carrying, flag, here, room]) == [
+        flag, room, carrying, here]
+
+
+def test_evaluate_with_cache(setup):
+    state, world = setup
+    c = Condition(type=ConditionType.FLAG_SET, target="door_open")
+    cache = {}
+    assert evaluate(c, state, world, cache) is True
+    state.clear_flag("door_open")
+    assert evaluate(c, state, world, cache) is True  # memoized
+    assert evaluate(c, state, world) is False
+
+
+def test_compiled_guard_matches_evaluate_all(setup):
+    state, world = setup
+    flag = Condition(type=ConditionType.FLAG_SET, target="door_open")
+    carrying = Condition(type=ConditionType.CARRYING, target="sword")
+    missing = Condition(type=ConditionType.CARRYING, target="key")
+    for conditions in ([], [flag], [missing], [flag, carrying],
+                       [flag, missing]):
+        guard = compile_guard(conditions)
+        expected = evaluate_all(conditions, state, world)
+        assert guard(state, world) is expected
+        assert guard(state, world, {}) is expected
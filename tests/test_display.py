@@ -0,0 +1,36 @@
+"""Tests for display helpers."""
+
+from engine.display import Pager, wrap
+
+
+def test_wrap_long_line():
+    text = "word " * 40
+    assert all(len(line) <= 72 for line in wrap(text).split("\n"))
+
+
+def test_wrap_keeps_blank_lines():
+    assert wrap("one\n\ntwo") == "one\n\ntwo"
+
+
+def test_pager_pauses_at_page_boundary(capsys):
+    prompts = []
+    pager = Pager(page_height=3, input_fn=prompts.append)
+    pager.write("a\nb\nc\nd\ne")
+    assert prompts == ["[press enter]"]
+    assert capsys.readouterr().out == "a\nb\nc\nd\ne\n"
+    assert pager.line_count == 2
+
+
+def test_pager_single_lines(capsys):
+    prompts = []
+    pager = Pager(page_height=2, input_fn=prompts.append)
+    for line in ("a", "b", "c"):
+        pager.write(line)
+    assert prompts == ["[press enter]"]
+    assert capsys.readouterr().out == "a\nb\nc\n"
+
+
+def test_pager_disabled(capsys):
+    pager = Pager(page_height=1, input_fn=lambda p: None, enabled=False)
+    pager.write("a\nb\nc")
+    assert capsys.readouterr().out == "a\nb\nc\n"
@@ -249,3 +249,135 @@ def test_swap_item(basic_setup):
     mgr.try_command_events(cmd, state, world)
     assert world.get_item("key").location == ItemLocation.NOWHERE.value
     assert world.get_item("gold_key").location == "room1"
+
+
+def test_equal_priority_keeps_declaration_order(basic_setup):
+    state, world = basic_setup
+    first = Event(id="first", verb="look",
+                  actions=[Action(type=ActionType.MESSAGE, value="FIRST")])
+    second = Event(id="second", verb="look",
+                   actions=[Action(type=ActionType.MESSAGE, value="SECOND")])
+    mgr = EventManager([first, second], [])
+    cmd = ParsedCommand(raw="look", verb="look")
+    _, msgs = mgr.try_command_events(cmd, state, world)
+    assert msgs == ["FIRST"]
+
+
+def test_messages_appended_to_buffer(basic_setup):
+    state, world = basic_setup
+    event = Event(id="hello", verb=None,
+                  actions=[Action(type=ActionType.MESSAGE, value="Hello.")])
+    mgr = EventManager([event], [])
+    buffer = ["Earlier."]
+    assert mgr.run_auto_events(state, world, buffer) is buffer
+    assert buffer == ["Earlier.", "Hello."]
+
+
+def test_room_and_global_command_events(basic_setup):
+    state, world = basic_setup
+    here = Event(id="here", verb="wave", room="room1", priority=1,
+                 actions=[Action(type=ActionType.MESSAGE, value="HERE")])
+    anywhere = Event(id="anywhere", verb="wave", priority=5,
+                     actions=[Action(type=ActionType.MESSAGE,
+                                     value="ANYWHERE")],
+                     conditions=[Condition(type=ConditionType.FLAG_SET,
+                                           target="waved")])
+    mgr = EventManager([here, anywhere], [])
+    cmd = ParsedCommand(raw="wave", verb="wave")
+
+    assert mgr.try_command_events(cmd, state, world)[1] == ["HERE"]
+    state.set_flag("waved")
+    assert mgr.try_command_events(cmd, state, world)[1] == ["ANYWHERE"]
+    state.clear_flag("waved")
+    state.enter_room("room2")
+    assert mgr.try_command_events(cmd, state, world)[1] == []
+
+
+def test_auto_event_sees_earlier_actions(basic_setup):
+    state, world = basic_setup
+    guard = [Condition(type=ConditionType.FLAG_UNSET, target="alarm")]
+    first = Event(id="first", verb=None, priority=2, conditions=guard,
+                  actions=[Action(type=ActionType.SET_FLAG, target="alarm")])
+    second = Event(id="second", verb=None, priority=1, conditions=guard,
+                   actions=[Action(type=ActionType.MESSAGE, value="Quiet.")])
+    mgr = EventManager([first, second], [])
+    assert mgr.run_auto_events(state, world) == []
+
+
+def test_add_event_keeps_firing_order(basic_setup):
+    state, world = basic_setup
+    def say(event_id, text, priority, room=None):
+        return Event(id=event_id, verb="shout", room=room, priority=priority,
+                     actions=[Action(type=ActionType.MESSAGE, value=text)])
+    mgr = EventManager([say("quiet", "QUIET", 1)], [])
+    cmd = ParsedCommand(raw="shout", verb="shout")
+    assert mgr.try_command_events(cmd, state, world)[1] == ["QUIET"]
+
+    mgr.add_event(say("echo", "ECHO", 5, room="room1"))
+    mgr.add_event(say("loud", "LOUD", 5))
+    assert [e.id for e in mgr.events] == ["echo", "loud", "quiet"]
+    assert mgr.try_command_events(cmd, state, world)[1] == ["ECHO"]
+    state.enter_room("room2")
+    assert mgr.try_command_events(cmd, state, world)[1] == ["LOUD"]
+
+
+def test_only_active_timers_tick(basic_setup):
+    state, world = basic_setup
+    first = Timer(name="first", counter="a")
+    second = Timer(name="second", counter="b")
+    mgr = EventManager([], [first, second])
+    mgr.register_timers(state)
+    state.set_counter("a", 5)
+    state.set_counter("b", 5)
+    state.enable_timer("second")
+    state.enable_timer("first")
+    assert state.active_timers == [first, second]  # registration order
+
+    state.disable_timer("first")
+    mgr.tick_timers(state, world)
+    assert state.get_counter("a") == 5
+    assert state.get_counter("b") == 4
+
+
+def test_spent_room_skips_auto_pass(basic_setup):
+    state, world = basic_setup
+    event = Event(id="greet", verb=None, room="room1", once=True,
+                  actions=[Action(type=ActionType.MESSAGE, value="Hi.")])
+    mgr = EventManager([event], [])
+    assert mgr.run_auto_events(state, world) == ["Hi."]
+    assert "room1" in state.auto_done
+    assert mgr.run_auto_events(state, world) == []
+
+    state.clear_flag(event.done_flag)
+    assert state.auto_done == set()
+    assert mgr.run_auto_events(state, world) == ["Hi."]
+
+
+
+def test_auto_pass_follows_teleport(basic_setup):
+    state, world = basic_setup
+
+    def say(text):
+        return Action(type=ActionType.MESSAGE, value=text)
+
+    events = [
+        Event(id="a", verb=None, room="room1", priority=2,
+              actions=[Action(type=ActionType.TELEPORT, target="room2")]),
+        Event(id="b", verb=None, room="room1", priority=1,
+              actions=[say("B (room1)")]),
+        Event(id="c", verb=None, room="room2", priority=0,
+              actions=[say("C (room2)")]),
+    ]
+    mgr = EventManager(events, [])
+    assert mgr.run_auto_events(state, world) == ["C (room2)"]
+    assert state.current_room == "room2"
+
+def test_timer_template_with_other_braces(basic_setup):
+    state, world = basic_setup
+    timer = Timer(name="o2", counter="oxygen",
+                  message_template="O2 {value}% {warn} {value}")
+    mgr = EventManager([], [timer])
+    mgr.register_timers(state)
+    state.set_counter("oxygen", 3)
+    state.enable_timer("o2")
+    assert mgr.tick_timers(state, world) == ["O2 2% {warn} 2"]
@@ -1,10 +1,11 @@
 """Integration tests: full walkthrough and data validation."""
 
 import pytest
+from collections import deque
 from pathlib import Path
 
 from engine.loader import (
-    load_manifest, load_rooms, load_items, load_events,
+    load_all, load_manifest, load_rooms, load_items, load_events,
     load_vocabulary, validate_world,
 )
 from main import run
@@ -39,6 +40,12 @@ class TestDataValidation:
         assert len(items) >= 10
         assert len(events) >= 20
 
+    def test_load_all_matches_individual_loaders(self):
+        events, timers = load_events(DATA_DIR)
+        assert load_all(DATA_DIR) == (
+            load_manifest(DATA_DIR), load_rooms(DATA_DIR),
+            load_items(DATA_DIR), events, timers, load_vocabulary(DATA_DIR))
+
     def test_validation_passes(self):
         rooms = load_rooms(DATA_DIR)
         items = load_items(DATA_DIR)
@@ -56,16 +63,15 @@ class TestDataValidation:
         """Check that most exits have a return path (not strict)."""
         rooms = load_rooms(DATA_DIR)
         room_map = {r.id: r for r in rooms}
+        # room ID -> IDs of the rooms its exits lead to
+        back_edges = {r.id: {ex.destination for ex in r.exits} for r in rooms}
         warnings = []
         for room in rooms:
             for ex in room.exits:
                 dest = room_map.get(ex.destination)
                 if dest is None:
                     continue
-                has_return = any(
-                    ret_ex.destination == room.id for ret_ex in dest.exits
-                )
-                if not has_return:
+                if room.id not in back_edges[dest.id]:
                     warnings.append(
                         f"{room.id} -> {dest.id} ({ex.direction.value}) "
                         f"has no return path"
@@ -118,17 +124,15 @@ class TestDataValidation:
         rooms = load_rooms(DATA_DIR)
         room_map = {r.id: r for r in rooms}
 
-        visited = set()
-        queue = [manifest.start_room]
+        # Rooms are marked when queued, so each is queued at most once
+        visited = {manifest.start_room}
+        queue = deque([manifest.start_room])
         while queue:
-            rid = queue.pop(0)
-            if rid in visited:
-                continue
-            visited.add(rid)
-            room = room_map.get(rid)
+            room = room_map.get(queue.popleft())
             if room:
                 for ex in room.exits:
                     if ex.destination not in visited:
+                        visited.add(ex.destination)
                         queue.append(ex.destination)
 
         unreachable = set(room_map.keys()) - visited
@@ -144,6 +148,12 @@ class TestGameplay:
         score = run(input_fn=_make_input_fn(commands))
         assert score == 0
 
+    def test_help_is_shown(self, capsys):
+        """HELP prints the help file, and repeating it prints it again."""
+        help_text = (DATA_DIR / "help.txt").read_text()
+        run(input_fn=_make_input_fn(["help", "?", "quit"]))
+        assert capsys.readouterr().out.count(help_text.splitlines()[0]) == 2
+
     def test_basic_puzzle_chain_1(self):
         """Complete puzzle chain 1: escape starting area."""
         commands = [
@@ -0,0 +1,56 @@
+"""Tests for the data loaders."""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from engine.loader import load_all, load_manifest, load_rooms
+
+DATA_DIR = Path(__file__).parent.parent / "game_data"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    d = tmp_path / "data"
+    shutil.copytree(DATA_DIR, d)
+    return d
+
+
+def test_missing_data_file_raises(data_dir):
+    (data_dir / "items.json").unlink()
+    with pytest.raises(FileNotFoundError):
+        load_all(data_dir)
+
+
+def test_load_all_interns_identifiers(data_dir):
+    manifest, rooms, items, events, timers, vocab = load_all(data_dir)
+    exit_ = rooms[0].exits[0]
+    assert exit_.destination is sys.intern(exit_.destination)
+    event = next(e for e in events if e.verb and e.conditions)
+    assert event.verb is sys.intern(event.verb)
+    target = event.conditions[0].target
+    assert target is sys.intern(target)
+    canonical = next(iter(vocab.noun_synonyms.values()))
+    assert canonical is sys.intern(canonical)
+
+
+def test_loaders_build_fresh_objects(data_dir):
+    first = load_rooms(data_dir)
+    first[0].name = "Mutated"
+    second = load_rooms(data_dir)
+    assert second[0] is not first[0]
+    assert second[0].name != "Mutated"
+
+
+def test_loader_sees_file_changes(data_dir):
+    assert load_manifest(data_dir).title == "Void Station Omega"
+    manifest_path = data_dir / "manifest.json"
+    data = json.loads(manifest_path.read_text())
+    data["title"] = "Changed"
+    manifest_path.write_text(json.dumps(data))
+    st = manifest_path.stat()
+    os.utime(manifest_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert load_manifest(data_dir).title == "Changed"
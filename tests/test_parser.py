@@ -100,3 +100,43 @@ def test_multi_word_noun(parser):
     cmd = parser.parse("examine some thing")
     assert cmd.verb == "examine"
     assert cmd.noun == "some thing"
+
+
+def test_with_pattern_synonyms(parser):
+    cmd = parser.parse("combine torch with card")
+    assert cmd.noun == "flashlight with keycard"
+
+
+def test_repeated_input(parser):
+    first = parser.parse("look")
+    parser.parse("north")
+    second = parser.parse("look")
+    assert second.verb == "look"
+    assert second is first
+
+
+def test_parse_cache_is_bounded(parser):
+    for n in range(2000):
+        parser.parse(f"examine thing{n}")
+    assert len(parser._cache) <= 512
+    assert parser.parse("examine thing1999").noun == "thing1999"
+
+
+def test_handler_attached():
+    def take(cmd, state, world):
+        return []
+    parser = Parser(Vocabulary(verb_synonyms={"get": "take"}),
+                    {"take": take})
+    assert parser.parse("get lamp").handler is take
+    assert parser.parse("dance").handler is None
+
+
+def test_word_in_several_tables():
+    vocab = Vocabulary(verb_synonyms={"light": "ignite"},
+                       noun_synonyms={"light": "lamp"})
+    assert vocab.words["light"] == ("ignite", "lamp", None)
+    assert vocab.words["up"] == (None, None, "up")
+    parser = Parser(vocab)
+    cmd = parser.parse("light light")
+    assert cmd.verb == "ignite"
+    assert cmd.noun == "lamp"
@@ -63,6 +63,25 @@ def test_save_load_roundtrip(setup):
     # Check item locations restored
     assert new_world.get_item("key").location == ItemLocation.INVENTORY.value
     assert new_world.get_item("sword").location == "room1"
+    assert new_world.find_item("key", ItemLocation.INVENTORY.value) is not None
+    assert new_world.find_item("key", "room1") is None
+
+
+def test_load_updates_in_place(setup):
+    state, world, path = setup
+    save_game(state, world, path)
+    flags, counters, visited = state.flags, state.counters, state.visited
+    sword = world.get_item("sword")
+    state.clear_flag("door_open")
+    state.set_counter("health", 1)
+    world.move_item("sword", ItemLocation.INVENTORY.value)
+
+    load_game(state, world, path)
+    assert state.flags is flags and "door_open" in flags
+    assert state.counters is counters and counters["health"] == 7
+    assert state.visited is visited
+    assert world.get_item("sword") is sword
+    assert sword.location == "room1"
 
 
 def test_load_no_file(setup):
@@ -81,3 +100,136 @@ def test_save_format(setup):
     assert "item_locations" in data
     assert data["state"]["score"] == 42
     assert data["item_locations"]["key"] == ItemLocation.INVENTORY.value
+
+
+def test_load_legacy_flag_dict(setup):
+    state, world, path = setup
+    save_game(state, world, path)
+    with open(path) as f:
+        data = json.load(f)
+    data["state"]["flags"] = {"door_open": True, "alarm": False}
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+    new_state = GameState()
+    load_game(new_state, world, path)
+    assert new_state.flag_is_set("door_open")
+    assert not new_state.flag_is_set("alarm")
+
+
+def test_state_to_json(setup):
+    state, _, _ = setup
+    data = json.loads(state.to_json())
+    assert data == state.to_dict()
+
+
+def test_load_corrupt_file(setup, tmp_path):
+    state, world, _ = setup
+    path = tmp_path / "corrupt.json"
+    path.write_text("{not json")
+    msg = load_game(state, world, str(path))
+    assert "error" in msg.lower()
+    assert state.score == 42
+
+
+def test_save_overwrites_atomically(setup, tmp_path):
+    state, world, path = setup
+    save_game(state, world, path)
+    state.score = 99
+    save_game(state, world, path)
+    with open(path) as f:
+        assert json.load(f)["state"]["score"] == 99
+    assert os.listdir(tmp_path) == ["test_save.json"]
+
+
+def test_save_to_missing_directory(setup, tmp_path):
+    state, world, _ = setup
+    msg = save_game(state, world, str(tmp_path / "missing" / "save.json"))
+    assert "error" in msg.lower()
+
+
+def test_save_pretty(setup):
+    state, world, path = setup
+    save_game(state, world, path, pretty=True)
+    with open(path) as f:
+        text = f.read()
+    assert "\n  " in text
+    assert json.loads(text)["state"]["score"] == 42
+
+
+def test_save_has_version(setup):
+    state, world, path = setup
+    save_game(state, world, path)
+    with open(path) as f:
+        assert json.load(f)["version"] == 2
+
+
+def test_msgpack_roundtrip(setup, tmp_path):
+    pytest.importorskip("msgpack")
+    state, world, _ = setup
+    path = str(tmp_path / "save.msgpack")
+    assert "saved" in save_game(state, world, path).lower()
+
+    new_state = GameState()
+    assert "loaded" in load_game(new_state, world, path).lower()
+    assert new_state.score == 42
+    assert new_state.flag_is_set("door_open")
+
+
+
+def test_save_load_with_path(setup, tmp_path):
+    state, world, _ = setup
+    path = tmp_path / "save.json"
+    assert "saved" in save_game(state, world, path).lower()
+
+    new_state = GameState()
+    assert "loaded" in load_game(new_state, world, path).lower()
+    assert new_state.score == 42
+
+def test_load_rejects_newer_version(setup):
+    state, world, path = setup
+    save_game(state, world, path)
+    with open(path) as f:
+        data = json.load(f)
+    data["version"] = 99
+    data["state"]["score"] = 1
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+    msg = load_game(state, world, path)
+    assert "newer" in msg
+    assert state.score == 42
+
+
+def test_corrupt_json_reported_as_json(setup, tmp_path):
+    state, world, _ = setup
+    for text in ("", "[1, 2", "garbage"):
+        path = tmp_path / "bad.json"
+        path.write_text(text)
+        msg = load_game(state, world, str(path))
+        assert msg.startswith("Error loading save")
+        assert "unpack" not in msg.lower()
+
+
+def test_save_file_mode(setup, tmp_path):
+    state, world, _ = setup
+    path = tmp_path / "mode.json"
+    old_umask = os.umask(0o022)
+    try:
+        save_game(state, world, str(path))
+        assert path.stat().st_mode & 0o777 == 0o644
+        path.chmod(0o600)
+        save_game(state, world, str(path))
+        assert path.stat().st_mode & 0o777 == 0o600
+    finally:
+        os.umask(old_umask)
+
+
+def test_failed_save_leaves_no_temp_file(setup, tmp_path, monkeypatch):
+    state, world, _ = setup
+    def fail(src, dst):
+        raise RuntimeError("interrupted")
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(RuntimeError):
+        save_game(state, world, str(tmp_path / "save.json"))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,77 @@
+"""Tests for world lookups and the item location index."""
+
+import pytest
+from engine.types import Item, ItemLocation, Room
+from engine.world import World
+
+
+def _item(item_id, location, aliases=()):
+    return Item(id=item_id, name=item_id, description="",
+                room_description="", location=location,
+                aliases=list(aliases))
+
+
+@pytest.fixture
+def world():
+    rooms = [Room(id="room1", name="Room 1", description="A room.")]
+    items = [
+        _item("apple", "room1", aliases=["fruit"]),
+        _item("banana", "room1", aliases=["fruit"]),
+        _item("cherry", ItemLocation.INVENTORY.value),
+        _item("ghost", ItemLocation.NOWHERE.value),
+    ]
+    return World(rooms, items)
+
+
+def test_items_in_room_keeps_catalog_order(world):
+    world.move_item("apple", ItemLocation.INVENTORY.value)
+    world.move_item("apple", "room1")
+    assert [i.id for i in world.items_in_room("room1")] == ["apple", "banana"]
+
+
+def test_items_in_inventory(world):
+    world.move_item("banana", ItemLocation.INVENTORY.value)
+    assert [i.id for i in world.items_in_inventory()] == ["banana", "cherry"]
+    assert world.items_in_room("room1")[0].id == "apple"
+
+
+def test_find_item_by_alias_and_location(world):
+    world.move_item("apple", ItemLocation.INVENTORY.value)
+    assert world.find_item("fruit", "room1").id == "banana"
+    assert world.find_item("fruit", ItemLocation.INVENTORY.value).id == "apple"
+    assert world.find_item("fruit", "elsewhere") is None
+
+
+def test_swap_item(world):
+    world.swap_item("apple", "ghost")
+    assert world.item_location("apple") == ItemLocation.NOWHERE.value
+    assert world.item_location("ghost") == "room1"
+    assert world.item_location("missing") == ItemLocation.NOWHERE.value
+
+
+def test_is_at(world):
+    assert world.is_at("cherry", ItemLocation.INVENTORY.value)
+    assert not world.is_at("apple", ItemLocation.INVENTORY.value)
+    world.move_item("apple", ItemLocation.INVENTORY.value)
+    assert world.is_at("apple", ItemLocation.INVENTORY.value)
+    assert not world.is_at("apple", "room1")
+    assert not world.is_at("missing", "room1")
+
+
+def test_find_exit():
+    from engine.types import Direction, Exit
+    room = Room(id="a", name="A", description="",
+                exits=[Exit(direction=Direction.EAST, destination="b")])
+    world = World([room, Room(id="b", name="B", description="")], [])
+    assert world.find_exit(room, Direction.EAST).destination == "b"
+    assert world.find_exit(room, Direction.WEST) is None
+
+
+def test_find_exit_first_listed_wins():
+    from engine.types import Direction, Exit
+    room = Room(id="a", name="A", description="",
+                exits=[Exit(direction=Direction.EAST, destination="b"),
+                       Exit(direction=Direction.EAST, destination="c")])
+    world = World([room, Room(id="b", name="B", description=""),
+                   Room(id="c", name="C", description="")], [])
+    assert world.find_exit(room, Direction.EAST).destination == "b"